@@ -0,0 +1 @@
+Support ``X | Y`` union types (PEP 604) when checking for union types on Python 3.10+.
@@ -1,6 +1,7 @@
 # Copyright (c) 2019 Stephen Bunn <stephen@bunn.io>
 # ISC License <https://choosealicense.com/licenses/isc>
 
+import weakref
 from typing import Any
 from functools import partialmethod
 from collections import OrderedDict
@@ -24,6 +25,9 @@ from .utils import (
 from .constants import CONFIG_KEY
 from .schema_builder import build_schema
 
+# cache of config classes to their pre-partitioned list of var dump instructions
+_DUMP_PLANS = weakref.WeakKeyDictionary()
+
 
 @attr.s(slots=True)
 class _ConfigEntry(object):
@@ -346,7 +350,7 @@ def _build(config_cls, dictionary, validate=False):  # noqa
                 if is_config_type(nested_type):
                     kwargs[var.name] = [
                         _build(nested_type, item)
-                        for item in dictionary.get(arg_key, [])
+                        for item in dictionary.get(arg_key, ())
                     ]
                 else:
                     kwargs[var.name] = typecast(arg_type, dictionary.get(arg_key, []))
@@ -385,6 +389,51 @@ def _build(config_cls, dictionary, validate=False):  # noqa
     return config_cls(**kwargs)
 
 
+def _get_dump_plan(config_cls):
+    """ Gets the instructions for dumping the vars of a given config class.
+
+    .. note:: Var types never change after a config class is built, so the handling of
+        each var is decided once per class and cached.
+
+    :param type config_cls: The config class to get the dump plan of
+    :return: A tuple of (dump key, var name, dump default, dump type, encoder, handling)
+        for each serialized var
+    :rtype: Tuple[Tuple[str, str, Any, Any, Callable, str], ...]
+    """
+
+    dump_plan = _DUMP_PLANS.get(config_cls)
+    if dump_plan is None:
+        dump_plan = []
+        for var in attr.fields(config_cls):
+            if not is_config_var(var):
+                continue
+
+            entry = var.metadata[CONFIG_KEY]
+            dump_key = entry.name if entry.name else var.name
+            dump_default = var.default if var.default else None
+            dump_type = entry.type if entry.type else var.type
+
+            if callable(entry.encoder):
+                handling = "encoder"
+            elif is_array_type(dump_type):
+                handling = "array"
+            elif is_enum_type(dump_type):
+                handling = "enum"
+            elif is_bytes_type(dump_type):
+                handling = "bytes"
+            elif is_config_type(dump_type):
+                handling = "config"
+            else:
+                handling = "value"
+
+            dump_plan.append(
+                (dump_key, var.name, dump_default, dump_type, entry.encoder, handling)
+            )
+        dump_plan = tuple(dump_plan)
+        _DUMP_PLANS[config_cls] = dump_plan
+    return dump_plan
+
+
 def _dump(config_instance, dict_type=OrderedDict):
     """ Dumps an instance from ``instance`` to a dictionary type mapping.
 
@@ -401,56 +450,42 @@ def _dump(config_instance, dict_type=OrderedDict):
         )
 
     result = dict_type()
-    for var in attr.fields(config_instance.__class__):
-        if not is_config_var(var):
-            continue
-
-        entry = var.metadata[CONFIG_KEY]
-        dump_key = entry.name if entry.name else var.name
-        dump_default = var.default if var.default else None
-        dump_type = entry.type if entry.type else var.type
-
-        if callable(entry.encoder):
-            result[dump_key] = entry.encoder(
-                getattr(config_instance, var.name, dump_default)
-            )
-            continue
-
-        if is_array_type(dump_type):
-            items = getattr(config_instance, var.name, [])
+    dump_plan = _get_dump_plan(config_instance.__class__)
+    for (dump_key, var_name, dump_default, dump_type, encoder, handling) in dump_plan:
+        if handling == "encoder":
+            result[dump_key] = encoder(getattr(config_instance, var_name, dump_default))
+        elif handling == "array":
+            items = getattr(config_instance, var_name, ())
             if items is not None:
                 result[dump_key] = [
                     (_dump(item, dict_type=dict_type) if is_config(item) else item)
                     for item in items
                 ]
-        elif is_enum_type(dump_type):
-            dump_value = getattr(config_instance, var.name, dump_default)
+        elif handling == "enum":
+            dump_value = getattr(config_instance, var_name, dump_default)
             result[dump_key] = (
                 dump_value.value if dump_value in dump_type else dump_value
             )
-        elif is_bytes_type(dump_type):
+        elif handling == "bytes":
             result[dump_key] = encode_bytes(
-                getattr(config_instance, var.name, dump_default)
+                getattr(config_instance, var_name, dump_default)
+            )
+        elif handling == "config":
+            result[dump_key] = _dump(
+                getattr(config_instance, var_name, {}), dict_type=dict_type
             )
         else:
-            if is_config_type(dump_type):
-                result[dump_key] = _dump(
-                    getattr(config_instance, var.name, {}), dict_type=dict_type
-                )
-            else:
-                dump_value = getattr(config_instance, var.name, dump_default)
-                if is_object_type(type(dump_value)):
-                    dump_value = {
-                        key: (
-                            _dump(value, dict_type=dict_type)
-                            if is_config(value)
-                            else value
-                        )
-                        for (key, value) in dump_value.items()
-                    }
-
-                if dump_value is not None:
-                    result[dump_key] = dump_value
+            dump_value = getattr(config_instance, var_name, dump_default)
+            if is_object_type(type(dump_value)):
+                dump_value = {
+                    key: (
+                        _dump(value, dict_type=dict_type) if is_config(value) else value
+                    )
+                    for (key, value) in dump_value.items()
+                }
+
+            if dump_value is not None:
+                result[dump_key] = dump_value
 
     return result
 
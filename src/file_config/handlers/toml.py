@@ -50,7 +50,7 @@ class TOMLHandler(BaseHandler):
         a-dependency = {name = "A Dependency",version = "v12"}
         """
 
-        inline_tables = set(kwargs.get("inline_tables", []))
+        inline_tables = set(kwargs.get("inline_tables", ()))
 
         def _dump_dict(dictionary, source, source_path=[]):
             for (key, value) in dictionary.items():
@@ -134,7 +134,7 @@ class TOMLHandler(BaseHandler):
         a-dependency = { name = "A Dependency", version = "v12" }
         """
 
-        inline_tables = set(kwargs.get("inline_tables", []))
+        inline_tables = set(kwargs.get("inline_tables", ()))
 
         def _dump_dict(dictionary, source, source_path=[]):
             for (key, value) in dictionary.items():
@@ -181,7 +181,7 @@ class TOMLHandler(BaseHandler):
         :rtype: str
         """
 
-        inline_tables = set(kwargs.get("inline_tables", []))
+        inline_tables = set(kwargs.get("inline_tables", ()))
         if len(inline_tables) > 0:
             warnings.warn("pytoml does not support 'inline_tables' argument")
         return pytoml.dumps(dictionary)
@@ -3,6 +3,7 @@
 
 import re
 import typing
+import weakref
 import warnings
 import collections
 
@@ -28,6 +29,22 @@ from .constants import CONFIG_KEY, REGEX_TYPE_NAME
 
 DEFAULT_SCHEMA_DRAFT = "http://json-schema.org/draft-07/schema#"
 SUPPORTED_SCHEMA_DRAFTS = (DEFAULT_SCHEMA_DRAFT,)
+DEFAULT_MODIFIER_IGNORE = frozenset(("type", "name", "required", "default"))
+ENUM_TYPE_CHECKS = (
+    ("bool", is_bool_type),
+    ("string", is_string_type),
+    ("number", is_number_type),
+    ("integer", is_integer_type),
+)
+
+# cache of config entry classes to a mapping of attribute names to allowed value types
+_MODIFIER_TYPES_CACHE = {}
+# record of (config entry id, modifier name) pairs that have already been warned about
+# NOTE: values are the config entries themselves so records are dropped along with
+# their entries and reused ids can be detected
+_WARNED_MODIFIERS = weakref.WeakValueDictionary()
+# cache of config classes to their serialized (var name, var, config entry) triples
+_CONFIG_VARS_CACHE = weakref.WeakKeyDictionary()
 
 
 def Regex(pattern):
@@ -41,27 +58,89 @@ def Regex(pattern):
     return typing.NewType(REGEX_TYPE_NAME, re.compile(pattern))
 
 
+def _get_modifier_types(entry_cls):
+    """ Gets the allowed modifier value types for the attributes of a config entry.
+
+    :param class entry_cls: The config entry class to get modifier types for
+    :return: A mapping of attribute names to the allowed value types (None if the
+        attribute does not specify a type)
+    :rtype: Dict[str, Optional[FrozenSet[type]]]
+    """
+
+    modifier_types = _MODIFIER_TYPES_CACHE.get(entry_cls)
+    if modifier_types is None:
+        modifier_types = {}
+        for entry_attribute in attr.fields(entry_cls):
+            allowed_types = entry_attribute.type
+            if isinstance(allowed_types, (list, tuple, set)):
+                allowed_types = frozenset(allowed_types)
+            elif allowed_types is not None:
+                allowed_types = frozenset((allowed_types,))
+            modifier_types[entry_attribute.name] = allowed_types
+        _MODIFIER_TYPES_CACHE[entry_cls] = modifier_types
+    return modifier_types
+
+
+def _join_path(property_path, name):
+    """ Joins a name onto the end of a given property path.
+
+    :param str property_path: The property path to join onto
+    :param str name: The name to join to the property path
+    :return: The joined property path
+    :rtype: str
+    """
+
+    if not property_path:
+        return name
+    return f"{property_path}/{name}"
+
+
+def _get_config_vars(config_cls):
+    """ Gets the serialized vars of a given config class.
+
+    :param class config_cls: The config class to get the serialized vars of
+    :return: A tuple of (var name, var, config entry) for each serialized var
+    :rtype: Tuple[Tuple[str, attr._make.Attribute, Any], ...]
+    """
+
+    config_vars = _CONFIG_VARS_CACHE.get(config_cls)
+    if config_vars is None:
+        config_vars = []
+        for var in attr.fields(config_cls):
+            if not is_config_var(var):
+                # encountered attribute is not a serialized field
+                # (i.e. missing CONFIG_KEY)
+                continue
+            entry = var.metadata[CONFIG_KEY]
+            config_vars.append((entry.name if entry.name else var.name, var, entry))
+        config_vars = tuple(config_vars)
+        _CONFIG_VARS_CACHE[config_cls] = config_vars
+    return config_vars
+
+
 def _build_attribute_modifiers(var, attribute_mapping, ignore=None):
     """ Handles adding schema modifiers for a given config var and some mapping.
 
     :param attr._make.Attribute var: The config var to build modifiers for
     :param Dict[str, str] attribute_mapping: A mapping of attribute to jsonschema
         modifiers
-    :param List[str] ignore: A list of mapping keys to ignore, defaults to None
+    :param List[str] ignore: A list of mapping keys to ignore,
+        defaults to ``DEFAULT_MODIFIER_IGNORE``
     :raises ValueError: When the given ``var`` is not an config var
     :raises ValueError: When jsonschema modifiers are given the wrong type
     :return: A dictionary of the built modifiers
     :rtype: Dict[str, Any]
     """
 
-    if not isinstance(ignore, list):
-        ignore = ["type", "name", "required", "default"]
+    if ignore is None:
+        ignore = DEFAULT_MODIFIER_IGNORE
     if not is_config_var(var):
         raise ValueError(
             f"cannot build field modifiers for {var!r}, is not a config var"
         )
 
     entry = var.metadata[CONFIG_KEY]
+    modifier_types = _get_modifier_types(type(entry))
     modifiers = {}
 
     for (entry_attribute, entry_value) in zip(
@@ -73,11 +152,8 @@ def _build_attribute_modifiers(var, attribute_mapping, ignore=None):
             elif entry_attribute.name in attribute_mapping:
                 # NOTE: stupid type comparisons required for off case where
                 # bool is a subclass of int `isinstance(True, (int, float)) == True`
-                if entry_attribute.type is not None and (
-                    type(entry_value) in entry_attribute.type
-                    if isinstance(entry_attribute.type, (list, tuple, set))
-                    else type(entry_value) == entry_attribute.type
-                ):  # noqa
+                allowed_types = modifier_types[entry_attribute.name]
+                if allowed_types is not None and type(entry_value) in allowed_types:
                     modifiers[attribute_mapping[entry_attribute.name]] = entry_value
                 else:
                     raise ValueError(
@@ -86,221 +162,200 @@ def _build_attribute_modifiers(var, attribute_mapping, ignore=None):
                         f"received {entry_value!r} of type {type(entry_value)!r}"
                     )
             else:
-                warnings.warn(
-                    f"field modifier {entry_attribute.name!r} has no effect on var "
-                    f"{var.name!r} of type {entry.type!r}"
-                )
+                # only warn about a useless modifier once per config entry
+                warned_key = (id(entry), entry_attribute.name)
+                if _WARNED_MODIFIERS.get(warned_key) is not entry:
+                    _WARNED_MODIFIERS[warned_key] = entry
+                    warnings.warn(
+                        f"field modifier {entry_attribute.name!r} has no effect on "
+                        f"var {var.name!r} of type {entry.type!r}"
+                    )
 
     return modifiers
 
 
-def _build_null_type(var, property_path=None):
+def _build_null_type(var, property_path=""):
     """ Builds schema definitions for null type values.
 
     :param var: The null type value
-    :param List[str] property_path: The property path of the current type,
-        defaults to None, optional
+    :param str property_path: The property path of the current type,
+        defaults to "", optional
     :return: The built schema definition
     :rtype: Dict[str, Any]
     """
 
-    if not property_path:
-        property_path = []
-
     return {"type": "null"}
 
 
-def _build_enum_type(var, property_path=None):
+def _build_enum_type(var, property_path=""):
     """ Builds schema definitions for enum type values.
 
     :param var: The enum type value
-    :param List[str] property_path: The property path of the current type,
-        defaults to None, optional
+    :param str property_path: The property path of the current type,
+        defaults to "", optional
     :return: The built schema definition
     :rtype: Dict[str, Any]
     """
 
-    if not property_path:
-        property_path = []
-
     entry = var.metadata[CONFIG_KEY]
     enum_values = [member.value for member in entry.type.__members__.values()]
     schema = {"enum": enum_values}
 
-    for (type_name, check) in dict(
-        bool=is_bool_type,
-        string=is_string_type,
-        number=is_number_type,
-        integer=is_integer_type,
-    ).items():
-        if all(check(type(_)) for _ in enum_values):
-            schema["type"] = type_name
+    # narrow down the possible schema types in a single pass over the enum values
+    type_checks = ENUM_TYPE_CHECKS
+    for value in enum_values:
+        value_type = type(value)
+        type_checks = [
+            (type_name, check)
+            for (type_name, check) in type_checks
+            if check(value_type)
+        ]
+        if not type_checks:
             break
 
+    if type_checks:
+        (type_name, _) = type_checks[0]
+        schema["type"] = type_name
+
     return schema
 
 
-def _build_bool_type(var, property_path=None):
+def _build_bool_type(var, property_path=""):
     """ Builds schema definitions for boolean type values.
 
     :param var: The boolean type value
-    :param List[str] property_path: The property path of the current type,
-        defaults to None, optional
+    :param str property_path: The property path of the current type,
+        defaults to "", optional
     :param property_path: [type], optional
     :return: The built schema definition
     :rtype: Dict[str, Any]
     """
 
-    if not property_path:
-        property_path = []
-
     return {"type": "boolean"}
 
 
-def _build_string_type(var, property_path=None):
+def _build_string_type(var, property_path=""):
     """ Builds schema definitions for string type values.
 
     :param var: The string type value
-    :param List[str] property_path: The property path of the current type,
-        defaults to None, optional
+    :param str property_path: The property path of the current type,
+        defaults to "", optional
     :param property_path: [type], optional
     :return: The built schema definition
     :rtype: Dict[str, Any]
     """
 
-    if not property_path:
-        property_path = []
-
-    schema = {"type": "string"}
     if is_builtin_type(var):
-        return schema
+        return {"type": "string"}
 
     if is_regex_type(var):
-        schema["pattern"] = var.__supertype__.pattern
-        return schema
+        return {"type": "string", "pattern": var.__supertype__.pattern}
 
     if is_config_var(var):
-        schema.update(
-            _build_attribute_modifiers(var, {"min": "minLength", "max": "maxLength"})
-        )
+        schema = {
+            "type": "string",
+            **_build_attribute_modifiers(var, {"min": "minLength", "max": "maxLength"}),
+        }
         if is_regex_type(var.type):
             schema["pattern"] = var.type.__supertype__.pattern
+        return schema
 
-    return schema
+    return {"type": "string"}
 
 
-def _build_integer_type(var, property_path=None):
+def _build_integer_type(var, property_path=""):
     """ Builds schema definitions for integer type values.
 
     :param var: The integer type value
-    :param List[str] property_path: The property path of the current type,
-        defaults to None, optional
+    :param str property_path: The property path of the current type,
+        defaults to "", optional
     :param property_path: [type], optional
     :return: The built schema definition
     :rtype: Dict[str, Any]
     """
 
-    if not property_path:
-        property_path = []
-
-    schema = {"type": "integer"}
-    if is_builtin_type(var):
-        return schema
-
-    if is_config_var(var):
-        schema.update(
-            _build_attribute_modifiers(var, {"min": "minimum", "max": "maximum"})
-        )
+    if not is_builtin_type(var) and is_config_var(var):
+        return {
+            "type": "integer",
+            **_build_attribute_modifiers(var, {"min": "minimum", "max": "maximum"}),
+        }
 
-    return schema
+    return {"type": "integer"}
 
 
-def _build_number_type(var, property_path=None):
+def _build_number_type(var, property_path=""):
     """ Builds schema definitions for number type values.
 
     :param var: The number type value
-    :param List[str] property_path: The property path of the current type,
-        defaults to None, optional
+    :param str property_path: The property path of the current type,
+        defaults to "", optional
     :param property_path: [type], optional
     :return: The built schema definition
     :rtype: Dict[str, Any]
     """
 
-    if not property_path:
-        property_path = []
-
-    schema = {"type": "number"}
-    if is_builtin_type(var):
-        return schema
-
-    if is_config_var(var):
-        schema.update(
-            _build_attribute_modifiers(var, {"min": "minimum", "max": "maximum"})
-        )
+    if not is_builtin_type(var) and is_config_var(var):
+        return {
+            "type": "number",
+            **_build_attribute_modifiers(var, {"min": "minimum", "max": "maximum"}),
+        }
 
-    return schema
+    return {"type": "number"}
 
 
-def _build_array_type(var, property_path=None):
+def _build_array_type(var, property_path=""):
     """ Builds schema definitions for array type values.
 
     :param var: The array type value
-    :param List[str] property_path: The property path of the current type,
-        defaults to None, optional
+    :param str property_path: The property path of the current type,
+        defaults to "", optional
     :param property_path: [type], optional
     :return: The built schema definition
     :rtype: Dict[str, Any]
     """
 
-    if not property_path:
-        property_path = []
-
-    schema = {"type": "array", "items": {"$id": f"#/{'/'.join(property_path)}/items"}}
+    items = {"$id": f"#/{property_path}/items"}
     if is_builtin_type(var):
-        return schema
+        return {"type": "array", "items": items}
 
+    modifiers = {}
     if is_config_var(var):
-        schema.update(
-            _build_attribute_modifiers(
-                var,
-                {
-                    "min": "minItems",
-                    "max": "maxItems",
-                    "unique": "uniqueItems",
-                    "contains": "contains",
-                },
-            )
+        modifiers = _build_attribute_modifiers(
+            var,
+            {
+                "min": "minItems",
+                "max": "maxItems",
+                "unique": "uniqueItems",
+                "contains": "contains",
+            },
         )
 
         if is_typing_type(var.type) and len(var.type.__args__) > 0:
             # NOTE: typing.List only allows one typing argument
             nested_type = var.type.__args__[0]
-            schema["items"].update(
-                _build(nested_type, property_path=property_path + ["items"])
+            items.update(
+                _build(nested_type, property_path=_join_path(property_path, "items"))
             )
     elif is_typing_type(var):
         nested_type = var.__args__[0]
-        schema["items"].update(
-            _build(nested_type, property_path=property_path + ["items"])
+        items.update(
+            _build(nested_type, property_path=_join_path(property_path, "items"))
         )
 
-    return schema
+    return {"type": "array", "items": items, **modifiers}
 
 
-def _build_object_type(var, property_path=None):
+def _build_object_type(var, property_path=""):
     """ Builds schema definitions for object type values.
 
     :param var: The object type value
-    :param List[str] property_path: The property path of the current type,
-        defaults to None, optional
+    :param str property_path: The property path of the current type,
+        defaults to "", optional
     :param property_path: [type], optional
     :return: The built schema definition
     :rtype: Dict[str, Any]
     """
 
-    if not property_path:
-        property_path = []
-
     schema = {"type": "object"}
     if is_builtin_type(var):
         return schema
@@ -332,20 +387,17 @@ def _build_object_type(var, property_path=None):
     return schema
 
 
-def _build_type(type_, value, property_path=None):
+def _build_type(type_, value, property_path=""):
     """ Builds the schema definition based on the given type for the given value.
 
     :param type_: The type of the value
     :param value: The value to build the schema definition for
-    :param List[str] property_path: The property path of the current type,
-        defaults to None, optional
+    :param str property_path: The property path of the current type,
+        defaults to "", optional
     :return: The built schema definition
     :rtype: Dict[str, Any]
     """
 
-    if not property_path:
-        property_path = []
-
     for (type_check, builder) in (
         (is_enum_type, _build_enum_type),
         (is_null_type, _build_null_type),
@@ -365,26 +417,23 @@ def _build_type(type_, value, property_path=None):
     return {}
 
 
-def _build_var(var, property_path=None):
+def _build_var(var, property_path=""):
     """ Builds a schema definition for a given config var.
 
     :param attr._make.Attribute var: The var to generate a schema definition for
-    :param List[str] property_path: The property path of the current type,
-        defaults to None, optional
+    :param str property_path: The property path of the current type,
+        defaults to "", optional
     :raises ValueError: When the given ``var`` is not a file_config var
     :return: The built schema definition
     :rtype: Dict[str, Any]
     """
 
-    if not property_path:
-        property_path = []
-
     if not is_config_var(var):
         raise ValueError(f"var {var!r} is not a config var")
 
     entry = var.metadata[CONFIG_KEY]
     var_name = entry.name if entry.name else var.name
-    schema = {"$id": f"#/{'/'.join(property_path)}/{var_name}"}
+    schema = {"$id": f"#/{property_path}/{var_name}"}
 
     if var.default is not None:
         schema["default"] = var.default
@@ -394,48 +443,53 @@ def _build_var(var, property_path=None):
             schema["title"] = entry.title
         if isinstance(entry.description, str):
             schema["description"] = entry.description
-        if (
+        if isinstance(entry.examples, str):
+            # NOTE: a single string is a single example rather than a sequence of them
+            schema["examples"] = [entry.examples]
+        elif (
             isinstance(entry.examples, collections.abc.Iterable)
+            and isinstance(entry.examples, collections.abc.Sized)
             and len(entry.examples) > 0
         ):
-            schema["examples"] = entry.examples
+            schema["examples"] = list(entry.examples)
 
     # handle typing.Union types by simply using the "anyOf" key
+    var_path = _join_path(property_path, var_name)
     if is_union_type(var.type):
         type_union = {"anyOf": []}
         for allowed_type in var.type.__args__:
             # NOTE: requires jsonschema draft-07
             type_union["anyOf"].append(
-                _build_type(
-                    allowed_type, allowed_type, property_path=property_path + [var_name]
-                )
+                _build_type(allowed_type, allowed_type, property_path=var_path)
             )
         schema.update(type_union)
     else:
-        schema.update(
-            _build_type(var.type, var, property_path=property_path + [var_name])
-        )
+        schema.update(_build_type(var.type, var, property_path=var_path))
     return schema
 
 
-def _build_config(config_cls, property_path=None):
+def _build_config(config_cls, property_path=""):
     """ Builds the schema definition for a given config class.
 
     :param class config_cls: The config class to build a schema definition for
-    :param List[str] property_path: The property path of the current type,
-        defaults to None, optional
+    :param str property_path: The property path of the current type,
+        defaults to "", optional
     :raises ValueError: When the given ``config_cls`` is not a config decorated class
     :return: The built schema definition
     :rtype: Dict[str, Any]
     """
 
-    if not property_path:
-        property_path = []
-
     if not is_config_type(config_cls):
         raise ValueError(f"class {config_cls!r} is not a config class")
 
-    schema = {"type": "object", "required": [], "properties": {}}
+    config_vars = _get_config_vars(config_cls)
+    schema = {
+        "type": "object",
+        "required": [
+            var_name for (var_name, _, entry) in config_vars if entry.required
+        ],
+        "properties": {},
+    }
     cls_entry = getattr(config_cls, CONFIG_KEY)
 
     # add schema title, defaults to config classes `__qualname__`
@@ -448,7 +502,7 @@ def _build_config(config_cls, property_path=None):
         schema["description"] = schema_description
 
     # if the length of the property path is 0, assume that current object is root
-    if len(property_path) <= 0:
+    if not property_path:
         schema_id = cls_entry.get("schema_id")
         if schema_id is None:
             schema_id = f"{config_cls.__qualname__}.json"
@@ -468,21 +522,13 @@ def _build_config(config_cls, property_path=None):
         schema["$schema"] = schema_draft
 
     else:
-        schema["$id"] = f"#/{'/'.join(property_path)}"
-
-    property_path.append("properties")
-    for var in attr.fields(config_cls):
-        if not is_config_var(var):
-            # encountered attribute is not a serialized field (i.e. missing CONFIG_KEY)
-            continue
-        entry = var.metadata[CONFIG_KEY]
-        var_name = entry.name if entry.name else var.name
-        if entry.required:
-            schema["required"].append(var_name)
+        schema["$id"] = f"#/{property_path}"
 
+    property_path = _join_path(property_path, "properties")
+    for (var_name, var, _) in config_vars:
         if is_config_type(var.type):
             schema["properties"][var_name] = _build_config(
-                var.type, property_path=property_path + [var_name]
+                var.type, property_path=_join_path(property_path, var_name)
             )
         else:
             schema["properties"][var_name] = _build_var(
@@ -492,26 +538,27 @@ def _build_config(config_cls, property_path=None):
     return schema
 
 
-def _build(value, property_path=None):
+def _build(value, property_path=""):
     """ The generic schema definition build method.
 
     :param value: The value to build a schema definition for
-    :param List[str] property_path: The property path of the current type,
-        defaults to None, optional
+    :param str property_path: The property path of the current type,
+        defaults to "", optional
     :return: The built schema definition
     :rtype: Dict[str, Any]
     """
 
-    if not property_path:
-        property_path = []
-
-    if is_config_type(value):
-        return _build_config(value, property_path=property_path)
+    # NOTE: only classes can be config or builtin types and config vars are never
+    # classes, so the class check lets us skip the predicates that can't match
+    if isinstance(value, type):
+        if is_config_type(value):
+            return _build_config(value, property_path=property_path)
+        elif is_builtin_type(value):
+            return _build_type(value, value, property_path=property_path)
     elif is_config_var(value):
         return _build_var(value, property_path=property_path)
-    elif is_builtin_type(value):
-        return _build_type(value, value, property_path=property_path)
-    elif is_regex_type(value):
+
+    if is_regex_type(value):
         # NOTE: building regular expression types assumes type is string
         return _build_type(str, value, property_path=property_path)
     elif is_typing_type(value):
@@ -535,4 +582,4 @@ def build_schema(config_cls):
     :rtype: dict
     """
 
-    return _build_config(config_cls, property_path=[])
+    return _build_config(config_cls, property_path="")
@@ -2,17 +2,22 @@
 # ISC License <https://choosealicense.com/licenses/isc>
 
 import re
-import base64
 import typing
-import itertools
 import collections
 from enum import Enum
 from functools import lru_cache
+from base64 import b64decode, b64encode
 
 import attr
 
 from .constants import CONFIG_KEY, REGEX_TYPE_NAME
 
+try:
+    from types import UnionType as _UnionType
+except ImportError:  # pragma: no cover
+    # NOTE: ``X | Y`` union types (PEP 604) are only available starting in Python 3.10
+    _UnionType = None
+
 
 class Types(Enum):
     """ An enum which keeps a record of top-level type grouping names.
@@ -34,7 +39,23 @@ class Types(Enum):
     UNION = "union"
 
 
-COMPILED_PATTERN_TYPE = type(re.compile(""))
+# NOTE: ``Types`` values bound as module-level names for use within the frequently
+# called ``is_x_type`` methods
+(_NULL, _BOOL, _BYTES, _INTEGER, _NUMBER, _STRING, _ARRAY, _OBJECT, _ENUM, _UNION) = (
+    Types.NULL,
+    Types.BOOL,
+    Types.BYTES,
+    Types.INTEGER,
+    Types.NUMBER,
+    Types.STRING,
+    Types.ARRAY,
+    Types.OBJECT,
+    Types.ENUM,
+    Types.UNION,
+)
+
+# NOTE: the public ``re.Pattern`` alias is only available starting in Python 3.7
+COMPILED_PATTERN_TYPE = getattr(re, "Pattern", None) or type(re.compile(""))
 TYPE_MAPPINGS = {
     "builtins": {
         Types.NULL: (type(None),),
@@ -65,6 +86,43 @@ TYPE_MAPPINGS = {
     },
 }
 
+# flattened record of all types within the ``TYPE_MAPPINGS`` for each ``Types`` value
+# NOTE: computed once as the ``TYPE_MAPPINGS`` are static and the ``is_x_type`` methods
+# are called frequently during schema building and typecasting
+_TYPES = {
+    type_: tuple(
+        mapped_type
+        for mappings in TYPE_MAPPINGS.values()
+        for mapped_type in mappings.get(type_, ())
+    )
+    for type_ in Types
+}
+# NOTE: frozensets are used for the ``type_ in ...`` membership checks while the tuples
+# are kept for ``issubclass`` checks
+_TYPE_SETS = {type_: frozenset(types) for (type_, types) in _TYPES.items()}
+# NOTE: the groups read by the ``typing`` origin and enum checks are bound directly
+# rather than being looked up from the type groups on each call
+_ENUM_TYPES = _TYPES[_ENUM]
+_UNION_TYPES = _TYPE_SETS[_UNION]
+_ARRAY_TYPES = _TYPE_SETS[_ARRAY]
+_OBJECT_TYPES = _TYPE_SETS[_OBJECT]
+# reverse index of each type within the ``TYPE_MAPPINGS`` to its ``Types`` value
+# NOTE: allows the ``is_x_type`` methods to resolve a type's group with a single lookup
+_TYPE_GROUPS = {type_: group for (group, types) in _TYPES.items() for type_ in types}
+# attrs attribute types which config vars are built on
+# NOTE: bound once to avoid resolving ``attr._make`` attributes on every check
+_ATTRIBUTE_TYPES = (attr._make.Attribute, attr._make._CountingAttr)
+# NOTE: the null, bool, integer and number type groups each only contain a single type
+# so their ``is_x_type`` methods simply compare identity against them
+((_NULL_TYPE,), (_BOOL_TYPE,), (_INTEGER_TYPE,), (_NUMBER_TYPE,)) = (
+    _TYPES[_NULL],
+    _TYPES[_BOOL],
+    _TYPES[_INTEGER],
+    _TYPES[_NUMBER],
+)
+# sentinel used to detect missing attributes without the cost of ``hasattr`` misses
+_MISSING = object()
+
 
 def _get_types(type_):
     """ Gathers all types within the ``TYPE_MAPPINGS`` for a specific ``Types`` value.
@@ -74,35 +132,35 @@ def _get_types(type_):
     :rtype: list
     """
 
-    return list(
-        itertools.chain.from_iterable(
-            map(lambda x: TYPE_MAPPINGS[x].get(type_, []), TYPE_MAPPINGS)
-        )
-    )
+    # NOTE: returns a new list so callers are free to extend the results
+    return list(_TYPES[type_])
 
 
 def encode_bytes(bytes_):
-    """ Encodes some given bytes into base64 using utf-8.
+    """ Encodes some given bytes into a single line base64 string.
 
     :param bytes bytes_: The bytes to encode
     :return: The bytes encoded base64 string
     :rtype: str
     """
 
-    return base64.encodebytes(bytes_).decode("utf-8")
+    # NOTE: base64 output is always ascii so there is no need for the utf-8 codec
+    return b64encode(bytes_).decode("ascii")
 
 
 def decode_bytes(string):
     """ Decodes a given base64 string into bytes.
 
+    .. note:: Newlines in the given string are discarded, so line wrapped base64
+        strings (as previously produced by :func:`encode_bytes`) are still supported.
+
     :param str string: The string to decode
     :return: The decoded bytes
     :rtype: bytes
     """
 
-    if is_string_type(type(string)):
-        string = bytes(string, "utf-8")
-    return base64.decodebytes(string)
+    # NOTE: b64decode accepts both ascii strings and bytes
+    return b64decode(string)
 
 
 def is_config_var(var):
@@ -113,11 +171,8 @@ def is_config_var(var):
     :rtype: bool
     """
 
-    return (
-        isinstance(var, (attr._make.Attribute, attr._make._CountingAttr))
-        and hasattr(var, "metadata")
-        and CONFIG_KEY in var.metadata
-    )
+    # NOTE: attrs always provides a metadata mapping on both attribute types
+    return isinstance(var, _ATTRIBUTE_TYPES) and CONFIG_KEY in var.metadata
 
 
 def is_config_type(type_):
@@ -128,10 +183,24 @@ def is_config_type(type_):
     :rtype: bool
     """
 
+    return isinstance(type_, type) and _is_config_class(type_)
+
+
+@lru_cache()
+def _is_config_class(cls):
+    """ Checks if the given class is ``file_config.config`` decorated.
+
+    .. note:: Only ever called with classes (which are always hashable) so the results
+        can be safely cached.
+
+    :param class cls: The class to check
+    :return: True if the class is config decorated, otherwise False
+    :rtype: bool
+    """
+
     return (
-        isinstance(type_, type)
-        and hasattr(type_, "__attrs_attrs__")
-        and hasattr(type_, CONFIG_KEY)
+        getattr(cls, "__attrs_attrs__", _MISSING) is not _MISSING
+        and getattr(cls, CONFIG_KEY, _MISSING) is not _MISSING
     )
 
 
@@ -143,10 +212,9 @@ def is_config(config_instance):
     :rtype: bool
     """
 
-    return isinstance(config_instance, object) and is_config_type(type(config_instance))
+    return is_config_type(config_instance.__class__)
 
 
-@lru_cache()
 def is_compiled_pattern(compiled_pattern):
     """ Checks if the given value is a compiled regex pattern.
 
@@ -158,7 +226,6 @@ def is_compiled_pattern(compiled_pattern):
     return isinstance(compiled_pattern, COMPILED_PATTERN_TYPE)
 
 
-@lru_cache()
 def is_builtin_type(type_):
     """ Checks if the given type is a bulitin type.
 
@@ -180,10 +247,9 @@ def is_enum_type(type_):
     :rtype: bool
     """
 
-    return isinstance(type_, type) and issubclass(type_, tuple(_get_types(Types.ENUM)))
+    return isinstance(type_, type) and issubclass(type_, _ENUM_TYPES)
 
 
-@lru_cache()
 def is_typing_type(type_):
     """ Checks if the given type is a ``typing`` module type.
 
@@ -192,10 +258,10 @@ def is_typing_type(type_):
     :rtype: bool
     """
 
+    # NOTE: not cached as hashing ``typing`` generics costs more than the check itself
     return getattr(type_, "__module__", None) == "typing"
 
 
-@lru_cache()
 def is_collections_type(type_):
     """ Checks if the given type is a ``collections`` module type
 
@@ -204,6 +270,7 @@ def is_collections_type(type_):
     :rtype: bool
     """
 
+    # NOTE: not cached as the lookup costs about as much as the check itself
     return (
         isinstance(type_, type) and getattr(type_, "__module__", None) == "collections"
     )
@@ -226,22 +293,21 @@ def is_regex_type(type_):
     )
 
 
-@lru_cache()
 def is_union_type(type_):
     """ Checks if the given type is a union type.
 
+    .. note:: Supports both ``typing.Union`` types and ``X | Y`` union types.
+
     :param type_: The type to check
     :return: True if the type is a union type, otherwise False
     :rtype: bool
     """
 
-    if is_typing_type(type_) and hasattr(type_, "__origin__"):
-        # NOTE: union types can only be from typing module
-        return type_.__origin__ in _get_types(Types.UNION)
-    return False
+    if _UnionType is not None and type_.__class__ is _UnionType:
+        return True
+    return is_typing_type(type_) and getattr(type_, "__origin__", None) in _UNION_TYPES
 
 
-@lru_cache()
 def is_null_type(type_):
     """ Checks if the given type is a null type.
 
@@ -250,10 +316,9 @@ def is_null_type(type_):
     :rtype: bool
     """
 
-    return type_ in _get_types(Types.NULL)
+    return type_ is _NULL_TYPE
 
 
-@lru_cache()
 def is_bool_type(type_):
     """ Checks if the given type is a bool type.
 
@@ -262,7 +327,7 @@ def is_bool_type(type_):
     :rtype: bool
     """
 
-    return type_ in _get_types(Types.BOOL)
+    return type_ is _BOOL_TYPE
 
 
 @lru_cache()
@@ -274,7 +339,7 @@ def is_bytes_type(type_):
     :rtype: bool
     """
 
-    return type_ in _get_types(Types.BYTES)
+    return _TYPE_GROUPS.get(type_) is _BYTES
 
 
 @lru_cache()
@@ -286,13 +351,11 @@ def is_string_type(type_):
     :rtype: bool
     """
 
-    string_types = _get_types(Types.STRING)
-    if is_typing_type(type_):
-        return type_ in string_types or is_regex_type(type_)
-    return type_ in string_types
+    # NOTE: regex types are checked directly rather than through the typing module check
+    # as ``typing.NewType`` only reports the ``typing`` module prior to Python 3.10
+    return _TYPE_GROUPS.get(type_) is _STRING or is_regex_type(type_)
 
 
-@lru_cache()
 def is_integer_type(type_):
     """ Checks if the given type is a integer type.
 
@@ -301,10 +364,9 @@ def is_integer_type(type_):
     :rtype: bool
     """
 
-    return type_ in _get_types(Types.INTEGER)
+    return type_ is _INTEGER_TYPE
 
 
-@lru_cache()
 def is_number_type(type_):
     """ Checks if the given type is a number type.
 
@@ -313,7 +375,7 @@ def is_number_type(type_):
     :rtype: bool
     """
 
-    return type_ in _get_types(Types.NUMBER)
+    return type_ is _NUMBER_TYPE
 
 
 @lru_cache()
@@ -325,14 +387,13 @@ def is_array_type(type_):
     :rtype: bool
     """
 
-    array_types = _get_types(Types.ARRAY)
-    if is_typing_type(type_):
-        return type_ in array_types or (
-            hasattr(type_, "__origin__") and type_.__origin__ in array_types
-        )
-    return type_ in array_types
+    if _TYPE_GROUPS.get(type_) is _ARRAY:
+        return True
+    # NOTE: only ``typing`` module types are expected to have an ``__origin__``
+    return is_typing_type(type_) and getattr(type_, "__origin__", None) in _ARRAY_TYPES
 
 
+@lru_cache()
 def is_object_type(type_):
     """ Checks if the given type is a object type.
 
@@ -341,57 +402,114 @@ def is_object_type(type_):
     :rtype: bool
     """
 
-    object_types = _get_types(Types.OBJECT)
-    if is_typing_type(type_):
-        return type_ in object_types or (
-            hasattr(type_, "__origin__") and type_.__origin__ in object_types
-        )
-    return type_ in object_types
+    if _TYPE_GROUPS.get(type_) is _OBJECT:
+        return True
+    # NOTE: only ``typing`` module types are expected to have an ``__origin__``
+    return is_typing_type(type_) and getattr(type_, "__origin__", None) in _OBJECT_TYPES
 
 
-def typecast(type_, value):
-    """ Tries to smartly typecast the given value with the given type.
+# mapping of the concrete types within the ``TYPE_MAPPINGS`` to the callables used to
+# typecast values to them
+# NOTE: allows typecasts to these types to skip the ``is_x_type`` checks entirely
+_TYPECASTS = {
+    type_: type_
+    for type_ in _TYPE_GROUPS
+    if isinstance(type_, type) and type_.__module__ in ("builtins", "collections")
+}
+_TYPECASTS.update(
+    {bytes: decode_bytes, bytearray: lambda value: bytearray(decode_bytes(value))}
+)
 
-    :param type_: The type to try to use for the given value
-    :param value: The value to try and typecast to the given type
-    :return: The typecasted value if possible, otherwise just the original value
+
+@lru_cache()
+def _get_typecast(type_):
+    """ Resolves the callable used to typecast values to the given type.
+
+    .. note:: The resolution only depends on the given type so it is cached and the
+        ``is_x_type`` checks are only ever run once for any given type.
+
+    :param type_: The type to resolve the typecast for
+    :return: A callable which typecasts a given value to the given type
+    :rtype: callable
     """
 
+    type_typecast = _TYPECASTS.get(type_)
+    if type_typecast is not None:
+        return type_typecast
+    # NOTE: ``typing.Optional[X]`` and ``X | None`` compare equal and share a cache
+    # entry, so all union types must resolve to the same (pass-through) typecast
+    if is_union_type(type_):
+        return lambda value: value
+
     # NOTE: does not do any special validation of types before casting
     # will just raise errors on type casting failures
-    if is_builtin_type(type_) or is_collections_type(type_) or is_enum_type(type_):
-        # FIXME: move to Types enum and TYPE_MAPPING entry
-        if is_bytes_type(type_):
-            return decode_bytes(value)
-        return type_(value)
+    # NOTE: reads the type's module once rather than through each is_x_type predicate
+    type_module = (
+        getattr(type_, "__module__", None) if isinstance(type_, type) else None
+    )
+    # NOTE: bytes types are always handled by the ``_TYPECASTS``
+    if type_module in ("builtins", "collections") or is_enum_type(type_):
+        return type_
     elif is_regex_type(type_):
-        return typecast(str, value)
+        return str
     elif is_typing_type(type_):
-        try:
-            base_type = type_.__extra__
-        except AttributeError:
-            # NOTE: when handling typing._GenericAlias __extra__ is actually __origin__
-            base_type = type_.__origin__
-        arg_types = type_.__args__
-
-        if is_array_type(type_):
-            if len(arg_types) == 1:
-                item_type = arg_types[0]
-                return base_type([typecast(item_type, item) for item in value])
-            else:
-                return base_type(value)
-        elif is_object_type(type_):
-            if len(arg_types) == 2:
-                (key_type, item_type) = arg_types
-                return base_type(
-                    {
-                        typecast(key_type, key): typecast(item_type, item)
-                        for (key, item) in value.items()
-                    }
-                )
-            else:
-                return base_type(value)
-        else:
-            return base_type(value)
+        return _get_typing_typecast(type_)
     else:
-        return value
+        return lambda value: value
+
+
+@lru_cache()
+def _get_typing_typecast(type_):
+    """ Builds the callable used to typecast values to the given ``typing`` type.
+
+    .. note:: The item typecasts of typed arrays and objects are resolved once when
+        building the callable, so nested typing types are never re-inspected while
+        typecasting values.
+
+    :param type_: The ``typing`` type to build the typecast for
+    :return: A callable which typecasts a given value to the given type
+    :rtype: callable
+    """
+
+    # NOTE: when handling typing._GenericAlias __extra__ is actually __origin__
+    base_type = getattr(type_, "__extra__", None) or getattr(type_, "__origin__", None)
+    if base_type is None:
+        # NOTE: special forms such as ``typing.Any`` and type variables have no origin
+        # to typecast values to, so values are passed through as they are
+        return lambda value: value
+
+    # NOTE: bare generics (such as ``typing.List``) have no ``__args__`` on Python 3.9+
+    arg_types = getattr(type_, "__args__", ())
+
+    if is_array_type(type_) and len(arg_types) == 1:
+        item_typecast = _get_typecast(arg_types[0])
+
+        # NOTE: mapping avoids both the comprehension frame and the intermediate list
+        def typecast_array(value):
+            return base_type(map(item_typecast, value))
+
+        return typecast_array
+    elif is_object_type(type_) and len(arg_types) == 2:
+        (key_typecast, item_typecast) = map(_get_typecast, arg_types)
+
+        def typecast_object(value):
+            return base_type(
+                {
+                    key_typecast(key): item_typecast(item)
+                    for (key, item) in value.items()
+                }
+            )
+
+        return typecast_object
+    return base_type
+
+
+def typecast(type_, value):
+    """ Tries to smartly typecast the given value with the given type.
+
+    :param type_: The type to try to use for the given value
+    :param value: The value to try and typecast to the given type
+    :return: The typecasted value if possible, otherwise just the original value
+    """
+
+    return _get_typecast(type_)(value)
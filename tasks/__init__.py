@@ -1,6 +1,7 @@
 # Copyright (c) 2019 Stephen Bunn <stephen@bunn.io>
 # ISC License <https://opensource.org/licenses/isc>
 
+import sys
 import getpass
 import pathlib
 import configparser
@@ -73,12 +74,13 @@ def clean(ctx):
 
 
 @invoke.task(pre=[clean, docs.build_news, build])  # noqa
-def publish(ctx, test=False, force=False, draft=False):
+def publish(ctx, test=False, force=False, draft=False, yes=False):
     """ Publish the project.
 
     :param bool test: Publishes to PyPi test server (defaults to False)
     :param bool force: Skip version check (defaults to False)
     :param bool draft: Sample publish (has no effect) (defaults to False)
+    :param bool yes: Skip the publish confirmation (defaults to False)
     """
 
     previous_version = get_previous_version(ctx)
@@ -125,25 +127,42 @@ def publish(ctx, test=False, force=False, draft=False):
 
     # get user to confirm publish
     try:
-        input(
-            report._get_text(
-                ctx,
-                "success",
-                "publish",
-                "about to publish, [Enter] to continue, [Ctrl-C] to abort: ",
+        # NOTE: non-interactive publishes must explicitly opt out of confirming
+        if not yes:
+            if not sys.stdin.isatty():
+                error_message = (
+                    "unable to confirm publish without a terminal, "
+                    "use --yes to publish non-interactively"
+                )
+                report.error(ctx, "publish", error_message)
+                raise ValueError(error_message)
+            input(
+                report._get_text(
+                    ctx,
+                    "success",
+                    "publish",
+                    "about to publish, [Enter] to continue, [Ctrl-C] to abort: ",
+                )
             )
-        )
 
         while True:
-            (username, password) = get_username_password(
+            (username, password, from_environment) = get_username_password(
                 ctx, "PyPi Username: ", "PyPi Password: "
             )
             # TODO: check if username and password are valid before tyring to post
             report.info(ctx, "publish", f"publishing project {ctx.metadata['name']!s}")
             if not draft:
-                publish_command += f" -u {username!r} -p {password!r}"
-                publish_result = ctx.run(publish_command, warn=True)
+                upload_command = f"{publish_command} -u {username!r} -p {password!r}"
+                publish_result = ctx.run(upload_command, warn=True)
                 if publish_result.exited:
+                    # NOTE: retrying with the same environment credentials never helps
+                    if from_environment:
+                        error_message = (
+                            f"failed to publish {ctx.metadata['name']!s} "
+                            "with credentials from the environment"
+                        )
+                        report.error(ctx, "publish", error_message)
+                        raise ValueError(error_message)
                     report.error(
                         ctx,
                         "publish",
@@ -156,10 +175,11 @@ def publish(ctx, test=False, force=False, draft=False):
         report.info(ctx, "publish", f"pushing git tags")
         if not draft:
             ctx.run(git_push_command)
-    except KeyboardInterrupt:
-        print()
+    except (KeyboardInterrupt, EOFError, ValueError) as exc:
+        if not isinstance(exc, ValueError):
+            print()
         report.error(ctx, "publish", "aborting publish!")
-        git_remove_tag_command = f"git tag -d {current_version!s}"
+        git_remove_tag_command = f"git tag -d v{current_version!s}"
         report.warn(ctx, "publish", "removing git tags")
         if not draft:
             ctx.run(git_remove_tag_command)
@@ -167,6 +187,9 @@ def publish(ctx, test=False, force=False, draft=False):
         report.warn(ctx, "publish", "softly reseting commit")
         if not draft:
             ctx.run(git_reset_command)
+        # NOTE: failures (unlike a user abort) should still fail the invoked task
+        if isinstance(exc, ValueError):
+            raise
 
 
 namespace = invoke.Collection(build, clean, publish, docs, package, profile)
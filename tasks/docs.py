@@ -1,10 +1,6 @@
 # Copyright (c) 2019 Stephen Bunn <stephen@bunn.io>
 # ISC License <https://opensource.org/licenses/isc>
 
-import pathlib
-import webbrowser
-from urllib.request import pathname2url
-
 import invoke
 
 from .utils import report
@@ -59,6 +55,10 @@ def view(ctx):
     """ Build and view docs.
     """
 
+    # NOTE: only viewing docs needs a browser so these are imported lazily
+    import webbrowser
+    from urllib.request import pathname2url
+
     report.info(ctx, "docs.view", f"viewing documentation")
     build_path = ctx.docs.directory / "build" / "html" / "index.html"
     build_path = pathname2url(build_path.as_posix())
@@ -1,13 +1,12 @@
 # Copyright (c) 2019 Stephen Bunn <stephen@bunn.io>
 # ISC License <https://opensource.org/licenses/isc>
 
-import re
 import shutil
 
 import invoke
 import parver
 
-from .utils import report, get_previous_version
+from .utils import report, update_assignment, get_previous_version
 
 
 @invoke.task
@@ -25,7 +24,7 @@ def clean(ctx):
         artifact_dir = ctx.directory / artifact
         if artifact_dir.is_dir():
             report.debug(ctx, "package.clean", f"removing directory {artifact_dir!s}")
-            ctx.run(f"rm -rf {artifact_dir!s}")
+            shutil.rmtree(artifact_dir, ignore_errors=True)
 
 
 @invoke.task
@@ -33,8 +32,9 @@ def format(ctx):
     """ Auto format package source files.
     """
 
-    isort_command = f"isort -rc {ctx.package.directory!s}"
-    black_command = f"black {ctx.package.directory.parent!s}"
+    package_dir = ctx.package.directory
+    isort_command = f"isort -rc {package_dir!s}"
+    black_command = f"black {package_dir.parent!s}"
 
     report.info(ctx, "package.format", "sorting imports")
     ctx.run(isort_command)
@@ -105,16 +105,6 @@ def version(ctx, version=None, force=False):
     :param bool force: If True, skips version check
     """
 
-    # define replacement strategies for files where the version needs to be in sync
-    updates = {
-        ctx.directory.joinpath("setup.cfg"): [
-            (r"^(version\s?=\s?)(.*)", "\\g<1>{version}")
-        ],
-        ctx.package.directory.joinpath("__version__.py"): [
-            (r"(__version__\s?=\s?)(.*)", '\\g<1>"{version}"')
-        ],
-    }
-
     previous_version = get_previous_version(ctx)
     if isinstance(version, str):
         version = parver.Version.parse(version)
@@ -127,20 +117,26 @@ def version(ctx, version=None, force=False):
     else:
         version = previous_version.bump_release(index=len(previous_version.release) - 1)
 
+    # define assignments to update in files where the version needs to be in sync
+    updates = {
+        ctx.directory.joinpath("setup.cfg"): ("version", f"{version!s}"),
+        ctx.package.directory.joinpath("__version__.py"): (
+            "__version__",
+            f'"{version!s}"',
+        ),
+    }
+
     report.info(ctx, "package.version", f"updating version to {version!s}")
-    for (path, replacements) in updates.items():
+    for (path, (name, value)) in updates.items():
         if path.is_file():
+            report.debug(
+                ctx, "package.version", f"updating {name!s} to {value!s} in {path!s}"
+            )
             content = path.read_text()
-            for (pattern, sub) in replacements:
-                report.debug(
-                    ctx,
-                    "package.version",
-                    f"applying replacement ({pattern!r}, {sub!r}) to {path!s}",
-                )
-                content = re.sub(
-                    pattern, sub.format(version=version), content, flags=re.M
-                )
-            path.write_text(content)
+            updated_content = update_assignment(content, name, value)
+            # NOTE: avoid touching files that already contain the version
+            if updated_content != content:
+                path.write_text(updated_content)
 
 
 @invoke.task
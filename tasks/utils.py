@@ -1,14 +1,15 @@
 # Copyright (c) 2019 Stephen Bunn <stephen@bunn.io>
 # ISC License <https://opensource.org/licenses/isc>
 
+import os
+import sys
 import getpass
 import pathlib
 import subprocess
+from functools import lru_cache
 
 import parver
 import colorama
-from towncrier._builder import find_fragments, split_fragments, render_fragments
-from towncrier._settings import load_config
 
 colorama.init()
 fg = colorama.Fore
@@ -23,6 +24,8 @@ class report(object):
     bg = colorama.Back
     sty = colorama.Style
     reset = colorama.Style.RESET_ALL
+    # NOTE: debug reports are only output when FILE_CONFIG_DEBUG is set
+    debug_enabled = bool(os.environ.get("FILE_CONFIG_DEBUG"))
     level_colors = dict(
         info=dict(task=[sty.BRIGHT, fg.CYAN], text=[fg.BLUE]),
         debug=dict(task=[sty.BRIGHT], text=[sty.DIM]),
@@ -30,17 +33,17 @@ class report(object):
         error=dict(task=[sty.BRIGHT, fg.RED], text=[fg.RED]),
         success=dict(task=[sty.BRIGHT, fg.GREEN], text=[sty.BRIGHT, fg.WHITE]),
     )
+    # NOTE: styles are joined once here rather than for every reported line
+    _level_styles = {
+        level: ("".join(colors["task"]), "".join(colors["text"]))
+        for (level, colors) in level_colors.items()
+    }
+    _default_styles = (fg.GREEN, fg.CYAN)
 
     @classmethod
     def _get_text(cls, ctx, level, task_name, text):
-        task_style = "".join(cls.level_colors.get(level, {}).get("task", [fg.GREEN]))
-        text_style = "".join(cls.level_colors.get(level, {}).get("text", [fg.CYAN]))
-
-        return (
-            f"{task_style}[{task_name}]{reset}"
-            f" {sty.DIM}...{sty.RESET_ALL} "
-            f"{text_style}{text}{reset}"
-        )
+        text_style = cls._level_styles.get(level, cls._default_styles)[-1]
+        return f"{_get_report_prefix(cls, level, task_name)}{text_style}{text}{reset}"
 
     @classmethod
     def info(cls, ctx, task_name, text):
@@ -48,7 +51,8 @@ class report(object):
 
     @classmethod
     def debug(cls, ctx, task_name, text):
-        print(cls._get_text(ctx, "debug", task_name, text))
+        if cls.debug_enabled:
+            print(cls._get_text(ctx, "debug", task_name, text))
 
     @classmethod
     def warning(cls, ctx, task_name, text):
@@ -67,20 +71,56 @@ class report(object):
         print(cls._get_text(ctx, "success", task_name, text))
 
 
+@lru_cache(maxsize=64)
+def _get_report_prefix(report_cls, level, task_name):
+    # NOTE: tasks tend to report many lines so their styled prefixes are reused
+    task_style = report_cls._level_styles.get(level, report_cls._default_styles)[0]
+    return f"{task_style}[{task_name}]{reset} {sty.DIM}...{sty.RESET_ALL} "
+
+
+@lru_cache(maxsize=1)
+def _get_git_tags():
+    # NOTE: tags are only read once per invoke run as chained tasks may all need them
+    return subprocess.check_output(["git", "tag"], encoding="ascii")
+
+
 def get_previous_version(ctx):
-    tags = [
-        tag.strip()
-        for tag in subprocess.check_output(["git", "tag"], encoding="ascii").split("\n")
-    ]
     try:
-        version = max(parver.Version.parse(ver).normalize() for ver in tags if ver)
+        tags = (tag.strip() for tag in _get_git_tags().splitlines())
+        version = max(
+            (parver.Version.parse(tag).normalize() for tag in tags if tag),
+            default=parver.Version.parse("0.0.0"),
+        )
     except (ValueError, subprocess.CalledProcessError):
         version = parver.Version.parse("0.0.0")
     return version
 
 
+def update_assignment(content, name, value):
+    lines = content.splitlines(keepends=True)
+    for (index, line) in enumerate(lines):
+        (key, separator, assigned) = line.partition("=")
+        if separator and not key[:1].isspace() and key.rstrip() == name:
+            spacing = assigned[: len(assigned) - len(assigned.lstrip(" \t"))]
+            line_ending = line[len(line.rstrip("\r\n")) :]
+            lines[index] = f"{key}{separator}{spacing}{value}{line_ending}"
+            break
+    return "".join(lines)
+
+
 def get_tag_content(ctx):
-    config = load_config(ctx.directory.as_posix())
+    # NOTE: the invoke context isn't hashable so rendered content is cached per
+    # project directory, avoiding re-reading the fragments and template
+    return _get_tag_content(ctx.directory.as_posix())
+
+
+@lru_cache(maxsize=4)
+def _get_tag_content(directory):
+    # NOTE: towncrier is only needed when publishing so it is imported lazily
+    from towncrier._builder import find_fragments, split_fragments, render_fragments
+    from towncrier._settings import load_config
+
+    config = load_config(directory)
     definitions = config["types"]
 
     (fragments, fragment_filenames) = find_fragments(
@@ -101,19 +141,43 @@ def get_tag_content(ctx):
 
 
 def get_artifact_paths(ctx):
-    return [ctx.directory.joinpath(_) for _ in (ctx.directory / "dist").iterdir()]
+    # NOTE: directory entries already know their type so no extra stat calls are made
+    with os.scandir(ctx.directory / "dist") as entries:
+        return [pathlib.Path(entry.path) for entry in entries if entry.is_file()]
 
 
 def get_username_password(
     ctx, username_label: str = "Username: ", password_label: str = "Password: "
 ):
-    while True:
-        username = input(report._get_text(ctx, "success", "publish", username_label))
-        if len(username) <= 0:
-            continue
+    # NOTE: credentials from the environment allow non-interactive publishing
+    username = os.environ.get("TWINE_USERNAME")
+    password = os.environ.get("TWINE_PASSWORD")
+    # NOTE: reported so callers know re-prompting can't correct these credentials
+    from_environment = bool(username or password)
+    if not (username and password) and not sys.stdin.isatty():
+        error_message = (
+            "unable to prompt for credentials without a terminal, "
+            "set TWINE_USERNAME and TWINE_PASSWORD instead"
+        )
+        report.error(ctx, "publish", error_message)
+        raise ValueError(error_message)
+
+    if not username:
+        username = input(
+            report._get_text(ctx, "success", "publish", username_label)
+        ).strip()
+        if not username:
+            error_message = "no username provided"
+            report.error(ctx, "publish", error_message)
+            raise ValueError(error_message)
+
+    if not password:
         password = getpass.getpass(
             report._get_text(ctx, "success", "publish", password_label)
         )
-        if len(password) <= 0:
-            continue
-        return (username, password)
+        if not password:
+            error_message = "no password provided"
+            report.error(ctx, "publish", error_message)
+            raise ValueError(error_message)
+
+    return (username, password, from_environment)
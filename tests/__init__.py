@@ -1,13 +1,32 @@
 # Copyright (c) 2019 Stephen Bunn <stephen@bunn.io>
 # ISC License <https://opensource.org/licenses/isc>
 
+import os
 import sys
 
-from hypothesis import settings, HealthCheck
+from hypothesis import Phase, settings, HealthCheck
 
 settings.register_profile(
     "windows", suppress_health_check=[HealthCheck.too_slow], deadline=None
 )
+# NOTE: quick smoke runs can skip shrinking and use fewer (reproducible) examples
+settings.register_profile(
+    "fast",
+    max_examples=25,
+    deadline=None,
+    derandomize=True,
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.data_too_large],
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+)
+settings.register_profile(
+    "thorough",
+    max_examples=500,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
 
 if sys.platform in ("win32",):
     settings.load_profile("windows")
+
+if "HYPOTHESIS_PROFILE" in os.environ:
+    settings.load_profile(os.environ["HYPOTHESIS_PROFILE"])
@@ -32,17 +32,20 @@ INI_SAFE_STRATEGIES = [
 INI_SAFE_STRATEGIES.append(lists(one_of(INI_SAFE_STRATEGIES)))
 INI_SAFE_STRATEGIES.append(config(allowed_strategies=INI_SAFE_STRATEGIES))
 
+# NOTE: one shared strategy keeps each test from rebuilding the same strategy tree
+INI_SAFE_CONFIG = config(allowed_strategies=INI_SAFE_STRATEGIES)
 
-@given(config(allowed_strategies=INI_SAFE_STRATEGIES))
-@settings(suppress_health_check=[HealthCheck.too_slow])
+
+@given(INI_SAFE_CONFIG)
+@settings(suppress_health_check=[HealthCheck.too_slow], deadline=None)
 def test_from_dict(config):
     config_dict = file_config.to_dict(config())
     parser = INIParser.from_dict(config_dict)
     assert isinstance(parser, INIParser)
 
 
-@given(config(allowed_strategies=INI_SAFE_STRATEGIES))
-@settings(suppress_health_check=[HealthCheck.too_slow])
+@given(INI_SAFE_CONFIG)
+@settings(suppress_health_check=[HealthCheck.too_slow], deadline=None)
 def test_to_dict(config):
     config_dict = file_config.to_dict(config())
     parser = INIParser.from_dict(config_dict)
@@ -50,8 +53,8 @@ def test_to_dict(config):
     assert isinstance(result, dict)
 
 
-@given(config(allowed_strategies=INI_SAFE_STRATEGIES))
-@settings(suppress_health_check=[HealthCheck.too_slow])
+@given(INI_SAFE_CONFIG)
+@settings(suppress_health_check=[HealthCheck.too_slow], deadline=None)
 def test_to_ini(config):
     parser = INIParser.from_dict(file_config.to_dict(config()))
     ini = io.StringIO(parser.to_ini())
@@ -60,8 +63,8 @@ def test_to_ini(config):
     assert isinstance(cfg_parser, configparser.ConfigParser)
 
 
-@given(config(allowed_strategies=INI_SAFE_STRATEGIES))
-@settings(suppress_health_check=[HealthCheck.too_slow])
+@given(INI_SAFE_CONFIG)
+@settings(suppress_health_check=[HealthCheck.too_slow], deadline=None)
 def test_from_ini(config):
     ini = INIParser.from_dict(file_config.to_dict(config())).to_ini()
     parser = INIParser.from_ini(ini)
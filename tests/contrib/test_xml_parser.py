@@ -30,8 +30,11 @@ XML_SAFE_STRATEGIES = [
 XML_SAFE_STRATEGIES.append(lists(one_of(XML_SAFE_STRATEGIES)))
 XML_SAFE_STRATEGIES.append(config(allowed_strategies=XML_SAFE_STRATEGIES))
 
+# NOTE: one shared strategy keeps each test from rebuilding the same strategy tree
+XML_SAFE_CONFIG = config(allowed_strategies=XML_SAFE_STRATEGIES)
 
-@given(config(allowed_strategies=XML_SAFE_STRATEGIES))
+
+@given(XML_SAFE_CONFIG)
 @settings(suppress_health_check=[HealthCheck.too_slow], deadline=None)
 def test_from_dict(config):
     config_dict = file_config.to_dict(config())
@@ -39,7 +42,7 @@ def test_from_dict(config):
     assert isinstance(parser, XMLParser)
 
 
-@given(config(allowed_strategies=XML_SAFE_STRATEGIES))
+@given(XML_SAFE_CONFIG)
 @settings(suppress_health_check=[HealthCheck.too_slow], deadline=None)
 def test_to_dict(config):
     config_dict = file_config.to_dict(config())
@@ -48,7 +51,7 @@ def test_to_dict(config):
     assert isinstance(result, dict)
 
 
-@given(config(allowed_strategies=XML_SAFE_STRATEGIES))
+@given(XML_SAFE_CONFIG)
 @settings(suppress_health_check=[HealthCheck.too_slow], deadline=None)
 def test_to_xml(config):
     parser = XMLParser.from_dict(file_config.to_dict(config()))
@@ -56,7 +59,7 @@ def test_to_xml(config):
     assert isinstance(etree.parse(io.StringIO(xml)), etree._ElementTree)
 
 
-@given(config(allowed_strategies=XML_SAFE_STRATEGIES))
+@given(XML_SAFE_CONFIG)
 @settings(suppress_health_check=[HealthCheck.too_slow], deadline=None)
 def test_from_xml(config):
     xml = XMLParser.from_dict(file_config.to_dict(config())).to_xml()
@@ -4,13 +4,10 @@
 import uuid
 
 import pytest
-from hypothesis import given, settings
 
 import file_config
 from file_config.handlers._common import BaseHandler
 
-from ..strategies import config_instance
-
 
 def test_handler_invalid():
     class A(BaseHandler):
@@ -31,14 +28,17 @@ def test_handler_invalid():
     assert not B.available()
 
 
-@settings(deadline=None)
-@given(config_instance(allow_nan=False))
-def test_handler_exceptions(instance):
+def test_handler_exceptions():
     class A(BaseHandler):
         name = "tes"
         packages = ("json",)
         options = {}
 
+    # NOTE: none of these checks depend on the config's content
+    instance = file_config.make_config("Config", {"foo": file_config.var(str)})(
+        foo="test"
+    )
+
     # make sure given preferred packages are in handler.packages
     with pytest.raises(ValueError):
         A()._prefer_package(uuid.uuid4().hex)
@@ -3,6 +3,7 @@
 
 import io
 
+import pytest
 from hypothesis import given, settings
 from hypothesis.strategies import text, booleans, characters
 
@@ -11,52 +12,29 @@ import file_config
 from ..strategies import config_instance
 
 
-@settings(deadline=None)
-@given(config_instance(allow_nan=False))
-def test_json_reflective(instance):
-    content = instance.dumps_json(prefer="json")
+def _assert_reflective(instance, prefer):
+    content = instance.dumps_json(prefer=prefer)
     assert isinstance(content, str)
     loaded = instance.__class__.loads_json(content)
     assert isinstance(loaded, instance.__class__)
     assert loaded == instance
 
     fake_io = io.StringIO()
-    instance.dump_json(fake_io, prefer="json")
+    instance.dump_json(fake_io, prefer=prefer)
     fake_io.seek(0)
 
     loaded = instance.__class__.load_json(fake_io)
     assert loaded == instance
 
 
+@pytest.mark.parametrize("prefer", ["json", "rapidjson"])
 @settings(deadline=None)
 @given(config_instance(allow_nan=False))
-def test_rapidjson_reflective(instance):
-    content = instance.dumps_json(prefer="rapidjson")
-    assert isinstance(content, str)
-    loaded = instance.__class__.loads_json(content)
-    assert isinstance(loaded, instance.__class__)
-    assert loaded == instance
-
-    fake_io = io.StringIO()
-    instance.dump_json(fake_io, prefer="rapidjson")
-    fake_io.seek(0)
-
-    loaded = instance.__class__.load_json(fake_io)
-    assert loaded == instance
+def test_json_reflective(prefer, instance):
+    _assert_reflective(instance, prefer)
 
 
 @settings(deadline=None)
 @given(config_instance(allowed_strategies=[characters(), text(), booleans()]))
 def test_ujson_reflective(instance):
-    content = instance.dumps_json(prefer="ujson")
-    assert isinstance(content, str)
-    loaded = instance.__class__.loads_json(content)
-    assert isinstance(loaded, instance.__class__)
-    assert loaded == instance
-
-    fake_io = io.StringIO()
-    instance.dump_json(fake_io, prefer="ujson")
-    fake_io.seek(0)
-
-    loaded = instance.__class__.load_json(fake_io)
-    assert loaded == instance
+    _assert_reflective(instance, "ujson")
@@ -4,7 +4,7 @@
 import io
 
 import attr
-from hypothesis import given, assume, settings
+from hypothesis import given, settings
 from hypothesis.strategies import integers
 
 import file_config
@@ -12,15 +12,13 @@ import file_config
 from ..strategies import config_instance
 
 
+# message pack can only store integers within the int64 / uint64 range
+MSGPACK_INT_BOUNDS = (-(2 ** 63), (2 ** 64) - 1)
+
+
 @settings(deadline=None)
-@given(config_instance(allow_nan=False))
+@given(config_instance(allow_nan=False, int_bounds=MSGPACK_INT_BOUNDS))
 def test_msgpack_reflective(instance):
-    for arg in instance.__attrs_attrs__:
-        instance_arg = getattr(instance, arg.name)
-        if isinstance(instance_arg, int):
-            # deal with message pack limitations in integer limits
-            assume(instance_arg >= -(2 ** 64) and instance_arg <= (2 ** 64) - 1)
-
     content = instance.dumps_msgpack(prefer="msgpack")
     assert isinstance(content, bytes)
     loaded = instance.__class__.loads_msgpack(content)
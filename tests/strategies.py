@@ -3,17 +3,20 @@
 
 import math
 import enum
-import random
+import string
 import keyword
+import operator
+from functools import lru_cache
 
 import attr
 from hypothesis import assume
 from hypothesis.strategies import (
     one_of,
-    from_regex,
     from_type,
     composite,
+    sampled_from,
     builds,
+    just,
     none,
     integers,
     booleans,
@@ -21,6 +24,7 @@ from hypothesis.strategies import (
     tuples,
     lists,
     sets,
+    dictionaries,
     frozensets,
     characters,
     text,
@@ -43,6 +47,23 @@ MAX_ENUM_VALUES = 5
 MIN_CONFIG_VARS = 1
 MAX_CONFIG_VARS = 5
 
+# NOTE: names are built directly from characters rather than through from_regex
+# as the regex engine (and stripping its trailing newlines) is comparatively slow
+NAME_CHARACTERS = string.ascii_letters + string.digits + "_"
+CLASS_NAME_STRATEGY = builds(
+    operator.add, sampled_from(string.ascii_letters), text(NAME_CHARACTERS)
+).filter(lambda name: not keyword.iskeyword(name))
+VARIABLE_NAME_STRATEGY = builds(
+    operator.add, sampled_from(string.ascii_lowercase), text(NAME_CHARACTERS)
+).filter(lambda name: not keyword.iskeyword(name))
+
+
+@lru_cache(maxsize=None)
+def _type_strategy(type_):
+    # NOTE: config var types are reused across many examples so their resolved
+    # strategies are kept rather than resolving from_type for every draw
+    return from_type(type_)
+
 
 @composite
 def builtins(draw, ignore=None, allow_nan=True):
@@ -52,10 +73,10 @@ def builtins(draw, ignore=None, allow_nan=True):
             integers(),
             booleans(),
             floats(allow_nan=False),
-            builds(tuple),
+            just(()),
             builds(list),
             builds(set),
-            builds(frozenset),
+            just(frozenset()),
             characters(),
             text(),
             binary(),
@@ -66,16 +87,12 @@ def builtins(draw, ignore=None, allow_nan=True):
 
 @composite
 def class_name(draw):
-    name = draw(from_regex(r"^[a-zA-Z]+[a-zA-Z0-9_]*$")).replace("\n", "")
-    assume(name not in keyword.kwlist)
-    return name
+    return draw(CLASS_NAME_STRATEGY)
 
 
 @composite
 def variable_name(draw):
-    name = draw(from_regex(r"^[a-z]+[a-zA-Z0-9_]*$")).replace("\n", "")
-    assume(name not in keyword.kwlist)
-    return name
+    return draw(VARIABLE_NAME_STRATEGY)
 
 
 @composite
@@ -95,12 +112,14 @@ def config_var_dict(
         min_vars = MIN_CONFIG_VARS
     if not isinstance(max_vars, int):
         max_vars = MAX_CONFIG_VARS
-    return {
-        draw(variable_name()): draw(
-            config_var(allowed_strategies=allowed_strategies, allow_nan=allow_nan)
-        )
-        for _ in range(MIN_CONFIG_VARS, random.randint(min_vars, max_vars) + 1)
-    }
+    # NOTE: strategies are built once rather than for every drawn config var
+    name_strategy = variable_name()
+    var_strategy = config_var(
+        allowed_strategies=allowed_strategies, allow_nan=allow_nan
+    )
+    return draw(
+        dictionaries(name_strategy, var_strategy, min_size=min_vars, max_size=max_vars)
+    )
 
 
 @composite
@@ -136,6 +155,7 @@ def config_instance(
     max_vars=None,
     allowed_strategies=None,
     allow_nan=True,
+    int_bounds=None,
 ):
     config_class = draw(
         config(
@@ -146,9 +166,19 @@ def config_instance(
             allow_nan=allow_nan,
         )
     )
+    # NOTE: bounding integers here avoids rejecting examples that some handlers
+    # can't represent (e.g. msgpack integers)
+    int_strategy = None
+    if isinstance(int_bounds, tuple):
+        (min_value, max_value) = int_bounds
+        int_strategy = integers(min_value=min_value, max_value=max_value)
+
     config_vars = {}
     for key, value in attr.fields_dict(config_class).items():
-        var_value = draw(from_type(value.type))
+        if int_strategy is not None and value.type is int:
+            var_value = draw(int_strategy)
+        else:
+            var_value = draw(_type_strategy(value.type))
         if not allow_nan and isinstance(var_value, float):
             assume(not math.isnan(var_value))
         config_vars[key] = var_value
@@ -159,10 +189,12 @@ def config_instance(
 def enums(draw):
     return enum.Enum(
         draw(class_name()),
-        {
-            draw(variable_name()): draw(one_of(characters(), integers()))
-            for _ in range(
-                MIN_ENUM_VALUES, random.randint(MIN_ENUM_VALUES, MAX_ENUM_VALUES) + 1
+        draw(
+            dictionaries(
+                variable_name(),
+                one_of(characters(), integers()),
+                min_size=MIN_ENUM_VALUES,
+                max_size=MAX_ENUM_VALUES,
             )
-        },
+        ),
     )
@@ -4,6 +4,7 @@
 import enum
 
 import typing
+import warnings
 import pytest
 from hypothesis import given, settings, assume
 from hypothesis.strategies import characters, sampled_from
@@ -132,6 +133,21 @@ def test_var_metadata(config_name, title, description, example):
     assert examples[0] == example
 
 
+def test_var_examples():
+    config = file_config.make_config(
+        "Config",
+        {
+            "single": file_config.var(str, examples="test"),
+            "invalid": file_config.var(int, examples=1),
+            "empty": file_config.var(str, examples=()),
+        },
+    )
+    schema = file_config.build_schema(config)
+    assert schema["properties"]["single"]["examples"] == ["test"]
+    assert "examples" not in schema["properties"]["invalid"]
+    assert "examples" not in schema["properties"]["empty"]
+
+
 @given(class_name(), variable_name(), config(config_vars={}))
 def test_nested_empty_config(config_name, nested_config_name, nested_config):
     config = file_config.make_config(
@@ -172,6 +188,16 @@ def test_string_var(config_name):
             file_config.build_schema(config)
 
 
+def test_regex_var_schema():
+    # NOTE: regex types only report the ``typing`` module prior to Python 3.10
+    config = file_config.make_config(
+        "Config", {"test": file_config.var(file_config.Regex(r"^[a-z]+$"))}
+    )
+    schema = file_config.build_schema(config)
+    assert schema["properties"]["test"]["type"] == "string"
+    assert schema["properties"]["test"]["pattern"] == r"^[a-z]+$"
+
+
 @given(class_name())
 def test_regex_var(config_name):
     type_ = file_config.Regex(r"test")
@@ -404,6 +430,17 @@ def test_var_modifier_exceptions(config_name):
         file_config.build_schema(config)
 
 
+def test_var_modifier_warns_once():
+    config = file_config.make_config("A", {"test": file_config.var(int, unique=True)})
+    with pytest.warns(UserWarning):
+        file_config.build_schema(config)
+
+    # useless modifiers should only be warned about the first time they are built
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        file_config.build_schema(config)
+
+
 def test_generic_build():
     config = file_config.make_config("A", {"test": file_config.var(str)})
     # build schema for config instance
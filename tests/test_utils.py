@@ -2,10 +2,13 @@
 # ISC License <https://opensource.org/licenses/isc>
 
 import re
+import sys
 import math
+import base64
 import typing
 import collections
 
+import pytest
 from hypothesis import given, assume, settings
 from hypothesis.strategies import (
     builds,
@@ -93,6 +96,25 @@ def test_is_union_type(value1, value2):
     assert not file_config.utils.is_union_type(type(value2))
 
 
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires PEP 604 unions")
+def test_is_union_type_pep604():
+    assert file_config.utils.is_union_type(int | str)
+    assert file_config.utils.is_union_type(int | None)
+    assert not file_config.utils.is_union_type(int)
+
+
+def test_typecast_union():
+    assert file_config.utils.typecast(typing.Optional[int], 5) == 5
+    assert file_config.utils.typecast(typing.List[typing.Optional[int]], [5]) == [5]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires PEP 604 unions")
+def test_typecast_union_pep604():
+    # NOTE: the equal ``typing`` union must be resolved first to share a cache entry
+    assert file_config.utils.typecast(typing.List[typing.Optional[int]], []) == []
+    assert file_config.utils.typecast(int | None, 5) == 5
+
+
 @given(none(), builtins())
 def test_is_null_type(none, other):
     assume(other != None)
@@ -228,6 +250,28 @@ def test_typecast_typings(value):
         )
 
 
+def test_typecast_nested_typings():
+    assert file_config.utils.typecast(
+        typing.Dict[str, typing.List[int]], {"test": ["1", "2"]}
+    ) == {"test": [1, 2]}
+    assert file_config.utils.typecast(
+        typing.List[typing.Set[float]], [["1.5"], ["2.5", "2.5"]]
+    ) == [{1.5}, {2.5}]
+
+
+def test_typecast_bare_typings():
+    assert file_config.utils.typecast(typing.List, ("1", "2")) == ["1", "2"]
+    assert file_config.utils.typecast(typing.Dict, [("test", "1")]) == {"test": "1"}
+
+
+def test_typecast_originless_typings():
+    assert file_config.utils.typecast(typing.List[typing.Any], []) == []
+    assert file_config.utils.typecast(typing.List[typing.Any], ["1", 2]) == ["1", 2]
+    assert file_config.utils.typecast(
+        typing.Dict[str, typing.List[typing.Any]], {"test": [1]}
+    ) == {"test": [1]}
+
+
 @given(binary())
 def test_encode_decode_bytes(value):
     encoded = file_config.utils.encode_bytes(value)
@@ -235,3 +279,19 @@ def test_encode_decode_bytes(value):
     decoded = file_config.utils.decode_bytes(encoded)
     assert isinstance(decoded, bytes)
     assert decoded == value
+
+
+@given(binary())
+def test_decode_wrapped_bytes(value):
+    # NOTE: bytes used to be encoded with newlines every 76 characters
+    encoded = base64.encodebytes(value).decode("utf-8")
+    assert file_config.utils.decode_bytes(encoded) == value
+
+
+@given(binary())
+def test_typecast_bytes(value):
+    encoded = file_config.utils.encode_bytes(value)
+    assert file_config.utils.typecast(bytes, encoded) == value
+    decoded = file_config.utils.typecast(bytearray, encoded)
+    assert isinstance(decoded, bytearray)
+    assert decoded == value